@@ -0,0 +1,208 @@
+"""API load test: throughput, latency percentiles and server memory per endpoint.
+
+    python -m benchmarks.bench_api --users 20 --jobs-per-user 2000 --concurrency 10 --duration 5
+    python -m benchmarks.bench_api --save-baseline    # store the results in benchmarks/baseline.json
+    python -m benchmarks.bench_api --compare          # exit 1 if anything regressed against the baseline
+
+All scenarios run one after another against a single uvicorn process on the same
+seeded database, with the job list cache off. jobs_cached repeats the jobs scenario
+with the cache on, and export runs with an export pool as large as --concurrency;
+each gets a uvicorn process of its own. Baselines are only comparable on the same machine with the same
+settings; the comparison warns when either differs.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from benchmarks.common import (
+    COMPANY_WORDS,
+    STATUSES,
+    create_users,
+    init_database,
+    main,
+    percentile,
+    remove_database,
+    run_requests,
+    run_server,
+    seed_jobs,
+    track_peak_rss,
+)
+
+PASSWORD = "password123"
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# scenario -> (user, rng) -> (method, path, headers, json body)
+SCENARIOS = {
+    "login": lambda user, rng: ("POST", "/auth/login", None, {"email": user["email"], "password": PASSWORD}),
+    "jobs": lambda user, rng: ("GET", "/jobs?limit=50", user["headers"], None),
+    "jobs_cached": lambda user, rng: ("GET", "/jobs?limit=50", user["headers"], None),
+    "jobs_filtered": lambda user, rng: (
+        "GET",
+        f"/jobs?limit=50&status={rng.choice(STATUSES)}&company={rng.choice(COMPANY_WORDS)}",
+        user["headers"],
+        None,
+    ),
+    "job": lambda user, rng: ("GET", f"/jobs/{rng.randint(user['first_job'], user['last_job'])}", user["headers"], None),
+    "summary": lambda user, rng: ("GET", "/analytics/summary", user["headers"], None),
+    "export": lambda user, rng: ("GET", "/export/csv", user["headers"], None),
+}
+
+def scenario_env(scenario, args):
+    """Server environment a scenario needs on top of run_server's defaults"""
+    if scenario == "jobs_cached":
+        return {"LIST_CACHE_BACKEND": "memory"}
+    if scenario == "export":
+        # Every client streams instead of all but EXPORT_MAX_CONCURRENT getting a 503
+        return {"EXPORT_MAX_CONCURRENT": str(args.concurrency)}
+    return {}
+
+# (metric, direction): +1 means higher is better
+METRICS = [("rps", 1), ("p50_ms", -1), ("p95_ms", -1), ("p99_ms", -1), ("peak_mb", -1)]
+
+
+class ScenarioRequests:
+    """Picklable request factory: a random seeded user for every request of one scenario."""
+
+    def __init__(self, scenario, users):
+        self.scenario = scenario
+        self.users = users
+
+    def __call__(self, rng):
+        return SCENARIOS[self.scenario](rng.choice(self.users), rng)
+
+
+def seed(database, users, jobs_per_user):
+    init_database(database)
+    created = create_users(database, users, PASSWORD)
+    for user_id, _, _ in created:
+        seed_jobs(database, user_id, jobs_per_user, seed=user_id)
+
+    main.DATABASE = database
+    with main.get_db() as conn:
+        ranges = {
+            row["user_id"]: (row["first_job"], row["last_job"])
+            for row in conn.execute(
+                "SELECT user_id, MIN(id) AS first_job, MAX(id) AS last_job FROM jobs GROUP BY user_id"
+            )
+        }
+    main.close_pool()
+    return [
+        {
+            "email": email,
+            "headers": {"Authorization": f"Bearer {token}"},
+            "first_job": ranges[user_id][0],
+            "last_job": ranges[user_id][1],
+        }
+        for user_id, email, token in created
+    ]
+
+
+def measure(base_url, pid, scenario, users, args):
+    requests = ScenarioRequests(scenario, users)
+    run_requests(base_url, requests, args.concurrency, args.warmup, args.processes)
+    with track_peak_rss(pid) as rss:
+        timings, errors = run_requests(base_url, requests, args.concurrency, args.duration, args.processes)
+    if not timings:
+        raise RuntimeError(f"{scenario}: no successful requests ({errors} errors)")
+    return {
+        "rps": round(len(timings) / args.duration, 1),
+        "p50_ms": round(percentile(timings, 0.50), 2),
+        "p95_ms": round(percentile(timings, 0.95), 2),
+        "p99_ms": round(percentile(timings, 0.99), 2),
+        "errors": errors,
+        "peak_mb": round(rss["peak"], 1),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Rows of (scenario, metric, baseline, current, change, regressed)."""
+    rows = []
+    for scenario, current in results.items():
+        previous = baseline["results"].get(scenario)
+        if previous is None:
+            continue
+        for metric, direction in METRICS:
+            before, after = previous[metric], current[metric]
+            change = (after - before) / before if before else 0.0
+            rows.append((scenario, metric, before, after, change, change * direction < -tolerance))
+    return rows
+
+
+def print_results(results):
+    print(f"{'scenario':<15}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}{'peak MiB':>10}")
+    for scenario, r in results.items():
+        print(f"{scenario:<15}{r['rps']:>9.1f}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}"
+              f"{r['errors']:>8}{r['peak_mb']:>10.1f}")
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--jobs-per-user", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=5, help="seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=1, help="seconds per scenario before measuring")
+    parser.add_argument("--processes", type=int, default=max((os.cpu_count() or 1) // 2, 1),
+                        help="load generator processes")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to --baseline")
+    parser.add_argument("--compare", action="store_true", help="compare the results with --baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative change before flagging")
+    args = parser.parse_args()
+
+    settings = {
+        "users": args.users, "jobs_per_user": args.jobs_per_user, "concurrency": args.concurrency,
+        "duration": args.duration, "processes": args.processes, "bcrypt_rounds": main.BCRYPT_ROUNDS,
+    }
+    machine = {"cpus": os.cpu_count(), "python": platform.python_version(), "platform": platform.platform()}
+
+    database = os.path.join(tempfile.mkdtemp(), "bench_api.db")
+    started = time.perf_counter()
+    users = seed(database, args.users, args.jobs_per_user)
+    print(f"seeded {args.users} users x {args.jobs_per_user} jobs in {time.perf_counter() - started:.1f}s")
+
+    results = {}
+    try:
+        # One server per distinct environment, scenarios in the order given
+        groups = {}
+        for scenario in args.scenarios:
+            env = scenario_env(scenario, args)
+            groups.setdefault(tuple(sorted(env.items())), []).append(scenario)
+        for env, scenarios in groups.items():
+            with run_server(database, env=dict(env)) as (base_url, pid):
+                for scenario in scenarios:
+                    results[scenario] = measure(base_url, pid, scenario, users, args)
+                    print(f"  {scenario}: {results[scenario]['rps']} req/s")
+        results = {scenario: results[scenario] for scenario in args.scenarios}
+    finally:
+        remove_database(database)
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump({"settings": settings, "machine": machine, "results": results}, file, indent=2)
+            file.write("\n")
+        print(f"baseline saved to {args.baseline}")
+
+    if args.compare:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline["settings"] != settings or baseline["machine"] != machine:
+            print("warning: baseline was recorded with different settings or on a different machine")
+        rows = compare(results, baseline, args.tolerance)
+        print(f"\n{'scenario':<15}{'metric':<9}{'baseline':>10}{'current':>10}{'change':>9}")
+        for scenario, metric, before, after, change, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{scenario:<15}{metric:<9}{before:>10.2f}{after:>10.2f}{change:>+9.0%}{flag}")
+        if any(row[-1] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
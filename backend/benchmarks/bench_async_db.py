@@ -0,0 +1,57 @@
+"""Async DB path benchmark: requests/sec and latency on /jobs for each DB_ACCESS_MODE.
+
+    python -m benchmarks.bench_async_db --concurrency 50 500 --duration 10
+
+Load is generated from separate processes so the client does not share an event loop
+with the measurement it is taking.
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks.common import (
+    create_user,
+    init_database,
+    percentile,
+    remove_database,
+    run_load,
+    run_server,
+    seed_jobs,
+)
+
+MODES = ["threadpool", "async"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--duration", type=float, default=10, help="seconds per run")
+    parser.add_argument("--processes", type=int, default=max((os.cpu_count() or 1) // 2, 1),
+                        help="load generator processes")
+    parser.add_argument("--path", default="/jobs?limit=20")
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(), "bench_async_db.db")
+    init_database(database)
+    user_id, token = create_user(database)
+    seed_jobs(database, user_id, args.jobs)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print(f"{'mode':>10} {'clients':>8} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    try:
+        for mode in MODES:
+            with run_server(database, env={"DB_ACCESS_MODE": mode}) as (base_url, _):
+                run_load(base_url, args.path, headers, 4, 1, 1)  # warm up
+                for concurrency in args.concurrency:
+                    timings, errors = run_load(base_url, args.path, headers, concurrency, args.duration,
+                                               args.processes)
+                    p50, p99 = percentile(timings, 0.5), percentile(timings, 0.99)
+                    print(f"{mode:>10} {concurrency:>8} {len(timings) / args.duration:>9.0f} "
+                          f"{p50:>8.1f} {p99:>8.1f} {errors:>7}")
+    finally:
+        remove_database(database)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Export benchmark: peak server RSS and time-to-first-byte for /export/csv.
+
+    python -m benchmarks.bench_export --rows 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.common import (
+    create_user,
+    init_database,
+    remove_database,
+    run_server,
+    seed_jobs,
+    sqlite_cache_budget_mb,
+    track_peak_rss,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument(
+        "--max-rss-growth-mb",
+        type=float,
+        default=sqlite_cache_budget_mb() + 32,
+        help="allowed heap growth: SQLite page cache plus a fixed slack, independent of --rows",
+    )
+    parser.add_argument("--max-ttfb", type=float, default=0.5, help="seconds")
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(), "bench_export.db")
+    init_database(database)
+    user_id, token = create_user(database)
+    started = time.perf_counter()
+    seed_jobs(database, user_id, args.rows)
+    print(f"seeded {args.rows} rows in {time.perf_counter() - started:.1f}s")
+
+    try:
+        with run_server(database) as (base_url, pid):
+            headers = {"Authorization": f"Bearer {token}"}
+            # Warm up imports and the connection pool before taking the baseline
+            httpx.get(base_url + "/jobs?limit=1", headers=headers)
+
+            size = 0
+            ttfb = None
+            with track_peak_rss(pid) as rss:
+                started = time.perf_counter()
+                with httpx.stream("GET", base_url + "/export/csv", headers=headers, timeout=None) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes():
+                        if ttfb is None:
+                            ttfb = time.perf_counter() - started
+                        size += len(chunk)
+                total = time.perf_counter() - started
+            growth = rss["peak"] - rss["baseline"]
+    finally:
+        remove_database(database)
+
+    print(f"exported {size / 1024 / 1024:.1f} MiB in {total:.2f}s ({args.rows / total:,.0f} rows/s)")
+    print(f"time to first byte: {ttfb * 1000:.1f} ms")
+    print(f"peak RSS growth: {growth:.1f} MiB")
+
+    failures = []
+    if growth > args.max_rss_growth_mb:
+        failures.append(f"peak RSS grew by {growth:.1f} MiB (limit {args.max_rss_growth_mb} MiB)")
+    if ttfb > args.max_ttfb:
+        failures.append(f"time to first byte {ttfb:.3f}s (limit {args.max_ttfb}s)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Search benchmark: company LIKE filter vs FTS5 `q` search on /jobs queries.
+
+    python -m benchmarks.bench_search --users 200 --jobs-per-user 5000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from benchmarks.common import init_database, main, remove_database, seed_jobs
+
+# From broad (about a tenth of a user's jobs) to narrow (a handful of rows)
+SEARCH_TERMS = ["Hooli", "Wonka Labs", "Tyrell Bank 42", "Cyberdyne Cloud 7"]
+
+
+def like_all_columns(user_id, term):
+    # What `q` would cost without an index: LIKE over every searchable column
+    pattern = f"%{term}%"
+    return (
+        "SELECT * FROM jobs WHERE user_id = ? AND (company_name LIKE ? OR position LIKE ? OR notes LIKE ?) "
+        "ORDER BY created_at DESC, id DESC",
+        [user_id, pattern, pattern, pattern],
+    )
+
+
+def measure(conn, queries):
+    timings = []
+    for query, params in queries:
+        started = time.perf_counter()
+        conn.execute(query, params).fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return statistics.mean(timings), timings[int(len(timings) * 0.95) - 1]
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--jobs-per-user", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(), "bench_search.db")
+    init_database(database)
+    started = time.perf_counter()
+    for user_id in range(1, args.users + 1):
+        seed_jobs(database, user_id, args.jobs_per_user, seed=user_id)
+    print(f"seeded {args.users * args.jobs_per_user} rows in {time.perf_counter() - started:.1f}s")
+
+    rng = random.Random(1)
+    workload = [(rng.randint(1, args.users), rng.choice(SEARCH_TERMS)) for _ in range(args.queries)]
+    like_queries = [main.build_jobs_query(user_id, company=term) for user_id, term in workload]
+    like_all_queries = [like_all_columns(user_id, term) for user_id, term in workload]
+    fts_queries = [
+        main.build_jobs_query(user_id, search=main.build_search_expression(term)) for user_id, term in workload
+    ]
+
+    main.DATABASE = database
+    try:
+        with main.get_db() as conn:
+            # Warm the page cache so both paths are measured hot
+            measure(conn, like_queries[:10] + like_all_queries[:10] + fts_queries[:10])
+            results = {
+                "LIKE company": measure(conn, like_queries),
+                "LIKE 3 cols": measure(conn, like_all_queries),
+                "FTS5 q": measure(conn, fts_queries),
+            }
+    finally:
+        main.close_pool()
+        remove_database(database)
+
+    print(f"{'path':<14}{'mean ms':>10}{'p95 ms':>10}")
+    for name, (mean, p95) in results.items():
+        print(f"{name:<14}{mean:>10.2f}{p95:>10.2f}")
+
+
+if __name__ == "__main__":
+    run()
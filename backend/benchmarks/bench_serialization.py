@@ -0,0 +1,86 @@
+"""Serialization microbenchmark: encoding a /jobs list body from fetched rows.
+
+    python -m benchmarks.bench_serialization --rows 10000
+
+"response_model" is the path FastAPI takes when a handler returns dicts: validate
+every row against the route's response model, jsonable_encoder, then json.dumps.
+The other paths project rows onto JobResponse fields and encode them directly.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from benchmarks.common import init_database, main, remove_database, seed_jobs
+
+
+def jobs_route():
+    return next(route for route in main.app.routes if getattr(route, "path", None) == "/jobs" and "GET" in route.methods)
+
+
+def response_model_body(rows, field):
+    content = asyncio.run(serialize_response(field=field, response_content=[dict(row) for row in rows]))
+    return JSONResponse(content).body
+
+
+def direct_body(rows):
+    return main.json_response([main.job_to_dict(row) for row in rows]).body
+
+
+def stdlib_body(rows):
+    orjson, main.orjson = main.orjson, None
+    try:
+        return direct_body(rows)
+    finally:
+        main.orjson = orjson
+
+
+def measure(encode, rows, repeat):
+    encode(rows)  # warm-up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = encode(rows)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), min(timings), len(body)
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(), "bench_serialization.db")
+    init_database(database)
+    seed_jobs(database, 1, args.rows)
+    main.DATABASE = database
+    try:
+        query, params = main.build_jobs_query(1)
+        with main.get_db() as conn:
+            rows = conn.execute(query, params).fetchall()
+    finally:
+        main.close_pool()
+        remove_database(database)
+
+    field = jobs_route().response_field
+    paths = {"response_model": lambda rows: response_model_body(rows, field), "stdlib json": stdlib_body}
+    if main.orjson is not None:
+        paths["orjson"] = direct_body
+    else:
+        print("orjson is not installed, skipping the orjson path")
+
+    print(f"{len(rows)} rows")
+    print(f"{'path':<16}{'median ms':>12}{'min ms':>10}{'bytes':>12}")
+    for name, encode in paths.items():
+        median, fastest, size = measure(encode, rows, args.repeat)
+        print(f"{name:<16}{median:>12.1f}{fastest:>10.1f}{size:>12}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,58 @@
+"""Worker scaling benchmark: /jobs throughput with 1..N uvicorn worker processes.
+
+    python -m benchmarks.bench_workers --workers 1 2 4 --concurrency 64
+
+Scaling is only meaningful with spare cores: the load generator runs on the
+same machine, so leave it some (see --processes).
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks.common import (
+    create_user,
+    init_database,
+    percentile,
+    remove_database,
+    run_load,
+    run_server,
+    seed_jobs,
+)
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, max(cpus // 2, 1)}))
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10, help="seconds per run")
+    parser.add_argument("--processes", type=int, default=max(cpus // 2, 1), help="load generator processes")
+    parser.add_argument("--path", default="/jobs?limit=20")
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(), "bench_workers.db")
+    init_database(database)
+    user_id, token = create_user(database)
+    seed_jobs(database, user_id, args.jobs)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print(f"{'workers':>8} {'req/s':>9} {'speedup':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    baseline = None
+    try:
+        for workers in args.workers:
+            with run_server(database, workers=workers) as (base_url, _):
+                # Warm every worker's pools and caches before measuring
+                run_load(base_url, args.path, headers, workers * 4, 2, args.processes)
+                timings, errors = run_load(base_url, args.path, headers, args.concurrency, args.duration,
+                                           args.processes)
+            throughput = len(timings) / args.duration
+            baseline = baseline or throughput
+            print(f"{workers:>8} {throughput:>9.0f} {throughput / baseline:>7.2f}x "
+                  f"{percentile(timings, 0.5):>8.1f} {percentile(timings, 0.99):>8.1f} {errors:>7}")
+    finally:
+        remove_database(database)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against a real uvicorn process on a throwaway database:
+
+    cd backend
+    python -m benchmarks.bench_export --rows 1000000
+"""
+import asyncio
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import main  # noqa: E402
+
+# Seeding runs huge batches by design; keep them out of the slow query log
+main.SLOW_QUERY_MS = float("inf")
+
+STATUSES = ["Applied", "Applied", "Applied", "Interview", "Rejected", "Rejected", "Offer"]
+COMPANY_WORDS = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Wonka", "Cyberdyne", "Tyrell"]
+COMPANY_SUFFIXES = ["Labs", "Systems", "Digital", "Cloud", "Analytics", "Group", "Software", "Bank"]
+POSITIONS = ["Python Developer", "Backend Engineer", "Data Engineer", "Site Reliability Engineer", "QA Automation"]
+NOTES = ["Referral", "Applied via LinkedIn", "Recruiter reached out", "Remote friendly", "Take-home task", None]
+
+# Started as `python -c SERVER_BOOTSTRAP <port> <workers>` with DATABASE_URL in the environment
+SERVER_BOOTSTRAP = """
+import sys
+import uvicorn
+uvicorn.run("main:app", host="127.0.0.1", port=int(sys.argv[1]), workers=int(sys.argv[2]), log_level="warning")
+"""
+
+
+def init_database(database):
+    main.DATABASE = database
+    main.init_db()
+
+
+def create_user(database, email="bench@example.com", password="password123"):
+    """Insert a user directly and return (user_id, access token)."""
+    main.DATABASE = database
+    with main.get_db() as conn:
+        cursor = conn.execute(
+            "INSERT INTO users (email, hashed_password, user_type) VALUES (?, ?, ?)",
+            (email, main.get_password_hash(password), "job_seeker"),
+        )
+        conn.commit()
+        user_id = cursor.lastrowid
+    return user_id, main.create_access_token(data={"sub": str(user_id)})
+
+
+def create_users(database, count, password="password123"):
+    """Insert `count` users sharing one password hash; returns [(user_id, email, token)].
+
+    The hash uses the server's BCRYPT_ROUNDS so logins verify without a rehash.
+    """
+    main.DATABASE = database
+    hashed_password = main.get_password_hash(password)
+    users = []
+    with main.get_db() as conn:
+        for i in range(count):
+            email = f"bench{i}@example.com"
+            cursor = conn.execute(
+                "INSERT INTO users (email, hashed_password, user_type) VALUES (?, ?, ?)",
+                (email, hashed_password, "job_seeker"),
+            )
+            users.append((cursor.lastrowid, email, main.create_access_token(data={"sub": str(cursor.lastrowid)})))
+        conn.commit()
+    return users
+
+
+def seed_jobs(database, user_id, count, batch_size=10000, seed=42):
+    """Insert `count` synthetic jobs for one user without holding them all in memory."""
+    rng = random.Random(seed)
+    main.DATABASE = database
+
+    def rows():
+        for i in range(count):
+            salary = f"{rng.randint(50, 300)}000"
+            yield (
+                user_id,
+                f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)} {rng.randint(1, 500)}",
+                rng.choice(POSITIONS),
+                rng.choice(STATUSES),
+                salary,
+                f"https://example.com/jobs/{i}",
+                rng.choice(NOTES),
+                # Same parsed columns the API writes, so salary filters have data to select
+                *main.parse_salary(salary),
+            )
+
+    generator = rows()
+    with main.get_db() as conn:
+        while True:
+            batch = [row for _, row in zip(range(batch_size), generator)]
+            if not batch:
+                break
+            conn.executemany(main.INSERT_JOB_QUERY, batch)
+        conn.commit()
+    main.close_pool()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def run_server(database, startup_timeout=15, env=None, workers=1):
+    """Run the app under uvicorn in a subprocess and yield (base_url, pid).
+
+    `env` holds extra environment variables for the server, e.g. executor settings.
+    The job list cache is off unless `env` turns it on, so repeated reads measure the
+    database path rather than cache hits.
+    With workers > 1, pid is the uvicorn supervisor rather than a worker.
+    """
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-c", SERVER_BOOTSTRAP, str(port), str(workers)],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "LIST_CACHE_BACKEND": "none", **(env or {}), "DATABASE_URL": database},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                httpx.get(base_url + "/", timeout=1)
+                break
+            except httpx.TransportError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("uvicorn did not start")
+                time.sleep(0.1)
+        yield base_url, process.pid
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+class FixedRequest:
+    """Request factory that sends the same GET every time."""
+
+    def __init__(self, path, headers):
+        self.path = path
+        self.headers = headers
+
+    def __call__(self, rng):
+        return "GET", self.path, self.headers, None
+
+
+async def drive(base_url, next_request, concurrency, stop_at, seed=0):
+    """Keep `concurrency` requests in flight until stop_at; returns (latencies in ms, errors).
+
+    next_request(rng) returns (method, path, headers, json body or None) for each request.
+    """
+    timings = []
+    errors = 0
+
+    async def worker(client, rng):
+        nonlocal errors
+        while time.time() < stop_at:
+            method, path, headers, body = next_request(rng)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, headers=headers, json=body)
+                response.raise_for_status()
+                # Streamed bodies (exports) count until the last byte
+                await response.aread()
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            timings.append((time.perf_counter() - started) * 1000)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await asyncio.gather(*(worker(client, random.Random(seed * 1000 + i)) for i in range(concurrency)))
+    return timings, errors
+
+
+def _load_process(base_url, next_request, concurrency, stop_at, seed, results):
+    results.put(asyncio.run(drive(base_url, next_request, concurrency, stop_at, seed)))
+
+
+def run_requests(base_url, next_request, concurrency, duration, processes=1):
+    """Drive requests from `next_request` in separate processes so the client never shares an
+    event loop with the measurement; returns (sorted latencies in ms, errors).
+
+    next_request must be picklable (a module-level class instance, not a lambda).
+    """
+    results = multiprocessing.Queue()
+    stop_at = time.time() + duration
+    shares = [concurrency // processes + (i < concurrency % processes) for i in range(processes)]
+    workers = [
+        multiprocessing.Process(target=_load_process, args=(base_url, next_request, share, stop_at, seed, results))
+        for seed, share in enumerate(shares) if share
+    ]
+    for worker in workers:
+        worker.start()
+    timings, errors = [], 0
+    for _ in workers:
+        part, part_errors = results.get()
+        timings.extend(part)
+        errors += part_errors
+    for worker in workers:
+        worker.join()
+    timings.sort()
+    return timings, errors
+
+
+def run_load(base_url, path, headers, concurrency, duration, processes=1):
+    """Drive GET `path` at a fixed concurrency; see run_requests."""
+    return run_requests(base_url, FixedRequest(path, headers), concurrency, duration, processes)
+
+
+def percentile(timings, fraction):
+    return timings[min(int(len(timings) * fraction), len(timings) - 1)]
+
+
+def anon_rss_mb(pid):
+    """Anonymous (heap) resident memory of a process in MiB (Linux only).
+
+    File-backed pages are left out on purpose: with mmap_size set, SQLite maps the
+    database file and those pages show up in VmRSS without being allocated memory.
+    """
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("RssAnon not available")
+
+
+@contextmanager
+def track_peak_rss(pid, interval=0.01):
+    """Sample a process' anonymous RSS in the background; yields a dict with baseline and peak."""
+    result = {"baseline": anon_rss_mb(pid)}
+    result["peak"] = result["baseline"]
+    stop = threading.Event()
+
+    def sample():
+        while not stop.is_set():
+            result["peak"] = max(result["peak"], anon_rss_mb(pid))
+            stop.wait(interval)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        yield result
+    finally:
+        stop.set()
+        sampler.join()
+        result["peak"] = max(result["peak"], anon_rss_mb(pid))
+
+
+def sqlite_cache_budget_mb():
+    """Upper bound of SQLite's per-connection page cache as configured in main.SQLITE_PRAGMAS."""
+    cache_size = main.SQLITE_PRAGMAS["cache_size"]
+    # Negative values are KiB, positive ones are pages (4 KiB by default)
+    return -cache_size / 1024 if cache_size < 0 else cache_size * 4 / 1024
+
+
+def remove_database(database):
+    for suffix in ("", "-wal", "-shm", ".lock"):
+        if os.path.exists(database + suffix):
+            os.remove(database + suffix)
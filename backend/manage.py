@@ -0,0 +1,276 @@
+"""Maintenance commands for the Job Tracker database.
+
+    python manage.py migrate --status          # schema version and pending migrations
+    python manage.py migrate                   # apply them while the app keeps serving,
+                                               # then parse salaries that older releases wrote
+    python manage.py check-counters            # report drift in job_counters
+    python manage.py check-counters --rebuild  # recompute them from jobs
+    python manage.py seed --users 100000 --jobs 10000000 --seed 1   # bulk-load synthetic data
+"""
+import argparse
+import bisect
+import logging
+import random
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+
+import main
+
+
+def migrate(args):
+    with main.get_db() as conn, main.schema_lock(conn):
+        current_version = main.get_schema_version(conn)
+        conn.commit()
+        pending = main.pending_migrations(current_version)
+        print(f"Schema version {current_version}, this release needs {main.SCHEMA_VERSION}")
+        if args.status:
+            for version, description, _ in pending:
+                print(f"  pending {version}: {description}")
+            return 1 if pending else 0
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+        applied = main.upgrade_schema(conn)
+        # Rows an older release wrote after the salary backfill ran have no parsed range yet
+        filled = main.fill_salary_columns(conn)
+        conn.commit()
+    print(f"Applied {len(applied)} migration(s)")
+    if filled:
+        print(f"Parsed salary for {filled} row(s)")
+    return 0
+
+
+def check_counters(args):
+    with main.get_db() as conn:
+        if args.rebuild:
+            drift = main.rebuild_counters(conn)
+            conn.commit()
+        else:
+            drift = main.check_counters(conn)
+
+    for entry in drift:
+        print(f"user {entry['user_id']}: expected {entry['expected']}, found {entry['actual']}")
+    if args.rebuild:
+        print(f"Rebuilt counters, repaired {len(drift)} user(s)")
+    else:
+        print(f"{len(drift)} user(s) with drifted counters")
+    return 1 if drift and not args.rebuild else 0
+
+
+# Synthetic data. Companies follow a Zipf-like skew, users a Pareto one (a few
+# very active job seekers), and a job's status depends on how old it is.
+COMPANY_PREFIXES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Wonka", "Cyberdyne",
+                    "Tyrell", "Soylent", "Massive", "Vandelay", "Pied Piper", "Aperture", "Black Mesa", "Oscorp",
+                    "Gringotts", "Monarch", "Nakatomi"]
+COMPANY_SUFFIXES = ["Labs", "Systems", "Digital", "Cloud", "Analytics", "Group", "Software", "Bank", "Health",
+                    "Logistics", "Games", "AI", "Media", "Energy", "Retail", "Capital"]
+POSITIONS = ["Python Developer", "Backend Engineer", "Frontend Developer", "Full Stack Developer", "Data Engineer",
+             "Data Scientist", "Site Reliability Engineer", "DevOps Engineer", "QA Automation Engineer",
+             "Mobile Developer", "Product Manager", "Engineering Manager", "ML Engineer", "Security Engineer"]
+NOTES = [None, None, None, "Referral", "Applied via LinkedIn", "Recruiter reached out", "Remote friendly",
+         "Take-home task", "Follow up next week", "Salary negotiable"]
+SALARIES = [None, None, None, "150 000 руб", "от 200 000 ₽", "100 000 - 150 000 руб", "250000", "до 300 000 руб",
+            "$120k-150k", "3000 EUR", "£45,000 - £55,000", "400 000 ₽", "договорная"]
+# Salary text -> parsed (salary_min, salary_max, salary_currency), parsed once per distinct value
+SALARY_COLUMNS = {salary: main.parse_salary(salary) for salary in SALARIES}
+# Counter and status triggers are replaced by one recount after the load; the epoch trigger stays on
+POSTGRES_BULK_TRIGGERS = ["trg_job_counters", "trg_job_counters_update", "trg_job_counters_touch",
+                          "trg_jobs_status_changed"]
+# (max age in days, {status: weight}): fresh applications are mostly still open
+STATUS_BY_AGE = [
+    (14, {"Applied": 80, "Interview": 12, "Rejected": 7, "Offer": 1}),
+    (60, {"Applied": 45, "Interview": 15, "Rejected": 35, "Offer": 5}),
+    (None, {"Applied": 25, "Interview": 5, "Rejected": 64, "Offer": 6}),
+]
+SEED_PASSWORD = "password123"
+
+
+def cumulative(weights):
+    total = 0
+    result = []
+    for weight in weights:
+        total += weight
+        result.append(total)
+    return result
+
+
+def company_names(count):
+    names = [f"{prefix} {suffix}" for suffix in COMPANY_SUFFIXES for prefix in COMPANY_PREFIXES]
+    return [names[i % len(names)] + (f" {i // len(names)}" if i >= len(names) else "") for i in range(count)]
+
+
+def generate_jobs(rng, user_ids, count, days, until):
+    """Yield job rows in creation order (ids grow with time, as in production)."""
+    user_weights = cumulative(rng.paretovariate(1.2) for _ in user_ids)
+    companies = company_names(max(200, min(count // 500, 50000)))
+    company_weights = cumulative(1 / (rank + 10) ** 1.1 for rank in range(len(companies)))
+    status_tables = [
+        (max_age, list(table), cumulative(table.values())) for max_age, table in STATUS_BY_AGE
+    ]
+    start = until - days * 86400
+    day_strings = {}
+
+    def timestamp(seconds):
+        day, second = divmod(int(seconds), 86400)
+        day_string = day_strings.get(day)
+        if day_string is None:
+            day_string = day_strings[day] = datetime.fromtimestamp(day * 86400, timezone.utc).strftime("%Y-%m-%d")
+        hours, second = divmod(second, 3600)
+        return f"{day_string} {hours:02d}:{second // 60:02d}:{second % 60:02d}"
+
+    random_ = rng.random
+    step = days * 86400 / count
+    for i in range(count):
+        created = start + (i + random_()) * step
+        age = (until - created) / 86400
+        for max_age, statuses, weights in status_tables:
+            if max_age is None or age < max_age:
+                break
+        status = statuses[bisect.bisect(weights, random_() * weights[-1])]
+        updated = created
+        if status != "Applied":
+            updated = min(created + random_() * 30 * 86400, until)
+        created_at = timestamp(created)
+        updated_at = timestamp(updated)
+        salary = SALARIES[int(random_() * len(SALARIES))]
+        yield (
+            user_ids[bisect.bisect(user_weights, random_() * user_weights[-1])],
+            companies[bisect.bisect(company_weights, random_() * company_weights[-1])],
+            POSITIONS[int(random_() * len(POSITIONS))],
+            status,
+            salary,
+            *SALARY_COLUMNS[salary],
+            f"https://jobs.example.com/{i}",
+            NOTES[int(random_() * len(NOTES))],
+            created_at,
+            updated_at,
+            None if status == "Applied" else updated_at,
+        )
+
+
+@contextmanager
+def deferred_indexes(conn, dialect):
+    """Drop job indexes and triggers for a bulk load, then rebuild them and the derived tables once."""
+    if dialect == "postgresql":
+        for _, name, _ in main.JOB_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        conn.execute("DROP INDEX IF EXISTS idx_jobs_search")
+        for name in POSTGRES_BULK_TRIGGERS:
+            conn.execute(f"ALTER TABLE jobs DISABLE TRIGGER {name}")
+        conn.commit()
+        try:
+            yield
+        finally:
+            for name in POSTGRES_BULK_TRIGGERS:
+                conn.execute(f"ALTER TABLE jobs ENABLE TRIGGER {name}")
+            for _, name, definition in main.JOB_INDEXES:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_search ON jobs USING GIN (search_vector)")
+            main.rebuild_counters(conn)
+            conn.execute("ANALYZE jobs")
+            conn.commit()
+        return
+
+    triggers = {**main.COUNTER_TRIGGERS, **main.SEARCH_TRIGGERS}
+    for _, name, _ in main.JOB_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    for name in triggers:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.commit()
+    try:
+        yield
+    finally:
+        for _, name, definition in main.JOB_INDEXES:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+        conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+        main.rebuild_counters(conn)
+        for name, definition in triggers.items():
+            conn.execute(f"CREATE TRIGGER {name} {definition}")
+        conn.execute("ANALYZE")
+        conn.commit()
+        conn.execute("PRAGMA synchronous = {}".format(main.SQLITE_PRAGMAS["synchronous"]))
+
+
+def seed(args):
+    rng = random.Random(args.seed)
+    # Every bulk statement is "slow"; don't log them
+    main.SLOW_QUERY_MS = float("inf")
+    until = datetime.combine(args.until, datetime.min.time(), timezone.utc).timestamp()
+    started = time.perf_counter()
+    with main.get_db() as conn:
+        first_user = (conn.execute("SELECT COALESCE(MAX(id), 0) AS last_id FROM users").fetchone()["last_id"]) + 1
+        user_ids = list(range(first_user, first_user + args.users))
+        # bcrypt once: every seeded user shares the same password
+        hashed_password = main.get_password_hash(SEED_PASSWORD)
+        conn.executemany(
+            "INSERT INTO users (id, email, hashed_password, user_type, created_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                (user_id, f"user{user_id}@example.com", hashed_password, "job_seeker",
+                 datetime.fromtimestamp(until - args.days * 86400, timezone.utc).strftime("%Y-%m-%d %H:%M:%S"))
+                for user_id in user_ids
+            ],
+        )
+        if main.get_pool().dialect == "postgresql":
+            # Explicit ids don't advance the serial sequence; registrations would collide
+            conn.execute("SELECT setval(pg_get_serial_sequence('users', 'id'), (SELECT MAX(id) FROM users))")
+        conn.commit()
+
+        inserted = 0
+        with deferred_indexes(conn, main.get_pool().dialect):
+            rows = generate_jobs(rng, user_ids, args.jobs, args.days, until)
+            while True:
+                batch = [row for _, row in zip(range(args.batch_size), rows)]
+                if not batch:
+                    break
+                conn.executemany(
+                    "INSERT INTO jobs (user_id, company_name, position, status, salary, salary_min, salary_max, "
+                    "salary_currency, link, notes, created_at, updated_at, status_changed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    batch,
+                )
+                conn.commit()
+                inserted += len(batch)
+                print(f"\r{inserted}/{args.jobs} jobs ({time.perf_counter() - started:.0f}s)", end="", flush=True)
+            print(f"\nbuilding indexes, search index and counters ({time.perf_counter() - started:.0f}s)")
+
+    print(f"Seeded {args.users} users and {inserted} jobs in {time.perf_counter() - started:.1f}s "
+          f"(password {SEED_PASSWORD!r})")
+    return 0
+
+
+def run(argv=None):
+    parser = argparse.ArgumentParser(description="Job Tracker maintenance commands")
+    parser.add_argument("--database", default=main.DATABASE, help="SQLite path or PostgreSQL URL (defaults to DATABASE_URL)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    schema = commands.add_parser("migrate", help="apply pending schema migrations")
+    schema.add_argument("--status", action="store_true", help="only list pending migrations (exit 1 if any)")
+    schema.set_defaults(handler=migrate, init_db=False)
+
+    counters = commands.add_parser("check-counters", help="verify materialized status counters")
+    counters.add_argument("--rebuild", action="store_true", help="recompute counters from jobs")
+    counters.set_defaults(handler=check_counters)
+
+    generate = commands.add_parser("seed", help="bulk-load synthetic users and jobs")
+    generate.add_argument("--users", type=int, default=1000)
+    generate.add_argument("--jobs", type=int, default=100000, help="total jobs across all users")
+    generate.add_argument("--days", type=int, default=3 * 365, help="spread created_at over this many days")
+    generate.add_argument("--until", type=date.fromisoformat, default=date.today(),
+                          help="last day of the data (YYYY-MM-DD); fix it to reproduce a dataset exactly")
+    generate.add_argument("--seed", type=int, default=0, help="random seed")
+    generate.add_argument("--batch-size", type=int, default=50000, help="rows per insert transaction")
+    generate.set_defaults(handler=seed)
+
+    args = parser.parse_args(argv)
+    main.DATABASE = args.database
+    if getattr(args, "init_db", True):
+        main.init_db()
+    try:
+        return args.handler(args)
+    finally:
+        main.close_pool()
+
+
+if __name__ == "__main__":
+    sys.exit(run())
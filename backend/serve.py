@@ -0,0 +1,47 @@
+"""Run the Job Tracker API with several uvicorn worker processes.
+
+    python serve.py                      # one worker per CPU core
+    python serve.py --workers 4 --port 8000
+
+Workers share nothing in memory: every in-process cache is either immutable
+per key (verified tokens) or keyed by job_counters.version, which lives in the
+database, so a write through one worker is seen by all of them. The worker
+count is passed on as WEB_CONCURRENCY, from which main picks backends that are
+safe across processes: the /ws change feed is relayed through the database
+and job lists are only cached in a shared Redis (LIST_CACHE_BACKEND=redis).
+A per-process backend set explicitly is refused before any worker starts.
+"""
+import argparse
+import os
+import sys
+
+import uvicorn
+
+import main
+
+
+def default_workers():
+    return int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+
+def run(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Job Tracker API")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=default_workers(), help="defaults to WEB_CONCURRENCY or CPU count")
+    args = parser.parse_args(argv)
+
+    # Spawned workers inherit the environment and import main afresh
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    main.check_worker_backends()
+
+    # Bring the schema up to date once before any worker starts; the workers'
+    # own startup calls then find it current under the schema lock
+    main.init_db()
+    main.close_pool()
+    uvicorn.run("main:app", host=args.host, port=args.port, workers=args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -4,6 +4,17 @@ let token = localStorage.getItem('token');
 let userType = localStorage.getItem('userType');
 let currentEditJobId = null;
 let currentTab = 'resume';
+const JOBS_PAGE_SIZE = 50;
+let loadedJobs = [];
+let jobsNextCursor = null;
+// Последние ответы по URL вместе с ETag: при 304 Not Modified используем сохранённую копию.
+// Map хранит порядок вставки, поэтому первый ключ - давно не использованный (LRU)
+const RESPONSE_CACHE_SIZE = 20;
+const responseCache = new Map();
+// Лента изменений /ws: события о вакансиях приходят во все открытые вкладки пользователя
+let feed = null;
+let feedRetries = 0;
+let feedRetryTimer = null;
 
 // Initialize app
 document.addEventListener('DOMContentLoaded', () => {
@@ -33,6 +44,7 @@ function showSuccess(message) {
 function showMainSection() {
     document.getElementById('authSection').classList.add('hidden');
     document.getElementById('mainSection').classList.remove('hidden');
+    connectFeed();
 }
 
 function showAuthSection() {
@@ -118,6 +130,8 @@ async function login() {
 }
 
 function logout() {
+    disconnectFeed();
+    responseCache.clear();
     token = null;
     userType = null;
     localStorage.removeItem('token');
@@ -286,10 +300,12 @@ function loadHistory() {
     const historyTimeline = document.getElementById('historyTimeline');
     
     // Получаем все вакансии и создаём историю
-    fetch(`${API_URL}/jobs`, {
-        headers: { 'Authorization': `Bearer ${token}` }
+    fetchCached(`${API_URL}/jobs`)
+    .then(res => {
+        if (!res.ok) throw new Error(`HTTP ${res.status}`);
+        // Копия: сортировка не должна менять закэшированный ответ
+        return [...res.data];
     })
-    .then(res => res.json())
     .then(jobs => {
         if (jobs.length === 0) {
             historyTimeline.innerHTML = `
@@ -360,30 +376,43 @@ async function exportToCSV() {
     }
 }
 
+// GET с If-None-Match: сервер отвечает 304, если данные не менялись
+async function fetchCached(url) {
+    const headers = { 'Authorization': `Bearer ${token}` };
+    const cached = responseCache.get(url);
+    if (cached) {
+        headers['If-None-Match'] = cached.etag;
+        responseCache.delete(url);
+        responseCache.set(url, cached);
+    }
+
+    const response = await fetch(url, { headers });
+    if (response.status === 304 && cached) {
+        return { ok: true, status: 200, data: cached.data };
+    }
+    if (!response.ok) {
+        return { ok: false, status: response.status };
+    }
+
+    const data = await response.json();
+    const etag = response.headers.get('ETag');
+    if (etag) {
+        responseCache.delete(url);
+        responseCache.set(url, { etag, data });
+        if (responseCache.size > RESPONSE_CACHE_SIZE) {
+            responseCache.delete(responseCache.keys().next().value);
+        }
+    }
+    return { ok: true, status: response.status, data };
+}
+
 // Analytics functions
 async function loadAnalytics() {
     try {
-        const response = await fetch(`${API_URL}/analytics/summary`, {
-            headers: { 'Authorization': `Bearer ${token}` }
-        });
+        const response = await fetchCached(`${API_URL}/analytics/summary`);
 
         if (response.ok) {
-            const data = await response.json();
-            
-            // Обновляем статистику для обеих ролей
-            if (document.getElementById('totalJobs')) {
-                document.getElementById('totalJobs').textContent = data.total_jobs;
-                document.getElementById('interviewJobs').textContent = data.interview;
-                document.getElementById('offerJobs').textContent = data.offer;
-                document.getElementById('interviewRate').textContent = data.interview_rate + '%';
-            }
-            
-            if (document.getElementById('totalJobs2')) {
-                document.getElementById('totalJobs2').textContent = data.total_jobs;
-                document.getElementById('interviewJobs2').textContent = data.interview;
-                document.getElementById('offerJobs2').textContent = data.offer;
-                document.getElementById('interviewRate2').textContent = data.interview_rate + '%';
-            }
+            renderAnalytics(response.data);
         } else if (response.status === 401) {
             logout();
         }
@@ -392,8 +421,106 @@ async function loadAnalytics() {
     }
 }
 
+function renderAnalytics(data) {
+    // Обновляем статистику для обеих ролей
+    if (document.getElementById('totalJobs')) {
+        document.getElementById('totalJobs').textContent = data.total_jobs;
+        document.getElementById('interviewJobs').textContent = data.interview;
+        document.getElementById('offerJobs').textContent = data.offer;
+        document.getElementById('interviewRate').textContent = data.interview_rate + '%';
+    }
+    
+    if (document.getElementById('totalJobs2')) {
+        document.getElementById('totalJobs2').textContent = data.total_jobs;
+        document.getElementById('interviewJobs2').textContent = data.interview;
+        document.getElementById('offerJobs2').textContent = data.offer;
+        document.getElementById('interviewRate2').textContent = data.interview_rate + '%';
+    }
+}
+
+// Change feed
+function feedIsOpen() {
+    return feed !== null && feed.readyState === WebSocket.OPEN;
+}
+
+// Изменения придут через ленту /ws; без неё перечитываем список
+function reloadUnlessFeedOpen() {
+    if (!feedIsOpen()) {
+        loadJobs();
+        loadAnalytics();
+    }
+}
+
+function connectFeed() {
+    if (!token || feed !== null) return;
+
+    // Токен передаётся как подпротокол, а не в URL, чтобы не попадать в логи
+    const socket = new WebSocket(`${API_URL.replace(/^http/, 'ws')}/ws`, ['bearer', token]);
+    feed = socket;
+
+    socket.onopen = () => {
+        // После переподключения могли пропустить события - перечитываем данные
+        if (feedRetries > 0) {
+            loadJobs();
+            loadAnalytics();
+        }
+        feedRetries = 0;
+    };
+    socket.onmessage = (message) => applyFeedEvent(JSON.parse(message.data));
+    socket.onclose = (event) => {
+        if (feed !== socket) return;
+        feed = null;
+        // 1008 - токен недействителен или истёк, переподключаться бессмысленно
+        if (!token || event.code === 1008) return;
+        const delay = Math.min(30000, 1000 * 2 ** feedRetries) * (0.5 + Math.random() / 2);
+        feedRetries += 1;
+        feedRetryTimer = setTimeout(connectFeed, delay);
+    };
+}
+
+function disconnectFeed() {
+    clearTimeout(feedRetryTimer);
+    feedRetries = 0;
+    if (feed !== null) {
+        const socket = feed;
+        feed = null;
+        socket.close();
+    }
+}
+
+function applyFeedEvent(event) {
+    if (event.summary) {
+        renderAnalytics(event.summary);
+    }
+    if (currentTab === 'history') {
+        loadHistory();
+    }
+
+    const isEmployer = userType === 'employer';
+    const filtered = document.getElementById(isEmployer ? 'filterStatus2' : 'filterStatus')?.value
+        || document.getElementById(isEmployer ? 'filterCompany2' : 'filterCompany')?.value
+        || (!isEmployer && document.getElementById('filterSalary')?.value);
+    // С фильтрами сервер решает, попадает ли запись в список; после resync и массовых операций (jobs.*) - тоже
+    if (filtered || event.type === 'resync' || event.type.startsWith('jobs.')) {
+        loadJobs();
+        if (event.type === 'resync') loadAnalytics();
+        return;
+    }
+
+    if (event.type === 'job.created') {
+        loadedJobs = [event.job, ...loadedJobs.filter(job => job.id !== event.job.id)];
+    } else if (event.type === 'job.updated') {
+        loadedJobs = loadedJobs.map(job => job.id === event.job.id ? event.job : job);
+    } else if (event.type === 'job.deleted') {
+        loadedJobs = loadedJobs.filter(job => job.id !== event.job_id);
+    } else {
+        return;
+    }
+    displayJobs(loadedJobs);
+}
+
 // Jobs functions
-async function loadJobs() {
+async function loadJobs(append = false) {
     // Для работодателя используем другие элементы
     const isEmployer = userType === 'employer';
     const statusId = isEmployer ? 'filterStatus2' : 'filterStatus';
@@ -401,19 +528,23 @@ async function loadJobs() {
     
     const status = document.getElementById(statusId)?.value || '';
     const company = document.getElementById(companyId)?.value || '';
+    const salaryMin = isEmployer ? '' : document.getElementById('filterSalary')?.value || '';
 
-    let url = `${API_URL}/jobs?`;
+    // Список загружается постранично, следующая страница - по курсору
+    let url = `${API_URL}/jobs?limit=${JOBS_PAGE_SIZE}&`;
     if (status) url += `status=${status}&`;
     if (company) url += `company=${encodeURIComponent(company)}&`;
+    if (salaryMin) url += `salary_min=${encodeURIComponent(salaryMin)}&`;
+    if (append && jobsNextCursor) url += `cursor=${encodeURIComponent(jobsNextCursor)}&`;
 
     try {
-        const response = await fetch(url, {
-            headers: { 'Authorization': `Bearer ${token}` }
-        });
+        const response = await fetchCached(url);
 
         if (response.ok) {
-            const jobs = await response.json();
-            displayJobs(jobs);
+            const page = response.data;
+            loadedJobs = append ? loadedJobs.concat(page.items) : page.items;
+            jobsNextCursor = page.next_cursor;
+            displayJobs(loadedJobs);
         } else if (response.status === 401) {
             logout();
         } else {
@@ -424,6 +555,12 @@ async function loadJobs() {
     }
 }
 
+function loadMoreJobs() {
+    if (jobsNextCursor) {
+        loadJobs(true);
+    }
+}
+
 function displayJobs(jobs) {
     const isEmployer = userType === 'employer';
     const jobsListId = isEmployer ? 'jobsList2' : 'jobsList';
@@ -489,7 +626,9 @@ function displayJobs(jobs) {
             </div>
         </div>
     `;
-    }).join('');
+    }).join('') + (jobsNextCursor
+        ? '<button class="btn btn-secondary load-more" onclick="loadMoreJobs()">Показать ещё</button>'
+        : '');
 }
 
 async function addJob() {
@@ -560,8 +699,7 @@ async function addJob() {
                 ? 'Вакансия успешно добавлена!' 
                 : 'Отклик успешно добавлен!';
             showSuccess(successMessage);
-            loadJobs();
-            loadAnalytics();
+            reloadUnlessFeedOpen();
         } else if (response.status === 401) {
             logout();
         } else {
@@ -592,8 +730,7 @@ async function deleteJob(jobId) {
         if (response.ok || response.status === 204) {
             const successMessage = isEmployer ? 'Кандидат удалён' : 'Вакансия удалена';
             showSuccess(successMessage);
-            loadJobs();
-            loadAnalytics();
+            reloadUnlessFeedOpen();
         } else if (response.status === 401) {
             logout();
         } else if (response.status === 404) {
@@ -678,8 +815,7 @@ async function saveEditJob() {
                 ? 'Кандидат успешно обновлён!' 
                 : 'Вакансия успешно обновлена!';
             showSuccess(successMessage);
-            loadJobs();
-            loadAnalytics();
+            reloadUnlessFeedOpen();
         } else if (response.status === 401) {
             logout();
         } else {